@@ -11,6 +11,7 @@ import io
 import json
 import locale
 import math
+import os
 import re
 import ssl
 import time
@@ -74,6 +75,11 @@ LCD_PIXELS_Y = 100
 LCD_ICON_SIZE_X = 200
 LCD_ICON_SIZE_Y = 100
 
+# Use the libyaml-backed loader when available, it parses considerably faster
+YAML_LOADER: type[yaml.SafeLoader] = (
+    yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader  # type: ignore[assignment]
+)
+
 console = Console()
 StateDict: TypeAlias = dict[str, dict[str, Any]]
 
@@ -1036,12 +1042,21 @@ class AsyncDelayedCallback:
         self.start_time = time.time()
         await asyncio.sleep(self.delay)
         self.is_sleeping = False
+        await self._call()
+
+    async def _call(self) -> None:
+        """Call the callback, awaiting it if it is a coroutine function."""
         if self.callback is not None:
             if asyncio.iscoroutinefunction(self.callback):
                 await self.callback()
             else:
                 self.callback()
 
+    async def _trigger_now(self) -> None:
+        """Cancel the pending sleep and call the callback right away."""
+        self.cancel()
+        await self._call()
+
     def is_running(self) -> bool:
         """Return whether the timer is running."""
         return self.task is not None and not self.task.done()
@@ -1629,6 +1644,25 @@ def _dial_attr(
         return 0
 
 
+@ft.lru_cache(maxsize=1)
+def _jinja_environment() -> jinja2.Environment:
+    """Return the Jinja environment shared by all template renders."""
+    env = jinja2.Environment(
+        loader=jinja2.BaseLoader(),
+        autoescape=False,  # noqa: S701
+    )
+    env.filters["min"] = _min_filter
+    env.filters["max"] = _max_filter
+    env.filters["is_number"] = _is_number_filter
+    return env
+
+
+@ft.lru_cache(maxsize=1000)
+def _compile_jinja(text: str) -> jinja2.Template:
+    """Compile a Jinja template, the same templates are rendered on every update."""
+    return _jinja_environment().from_string(text)
+
+
 def _render_jinja(
     text: str,
     complete_state: StateDict,
@@ -1640,14 +1674,7 @@ def _render_jinja(
     if "{" not in text:
         return text
     try:
-        env = jinja2.Environment(
-            loader=jinja2.BaseLoader(),
-            autoescape=False,  # noqa: S701
-        )
-        env.filters["min"] = _min_filter
-        env.filters["max"] = _max_filter
-        env.filters["is_number"] = _is_number_filter
-        template = env.from_string(text)
+        template = _compile_jinja(text)
         return template.render(
             min=min,
             max=max,
@@ -1739,6 +1766,16 @@ def _convert_to_grayscale(image: Image.Image) -> Image.Image:
     return image.convert("L").convert("RGB")
 
 
+def _tmp_filename(filename: Path) -> Path:
+    """Return a process-unique temporary filename next to `filename`.
+
+    Files are written there first and then moved into place, so that other
+    processes sharing the assets folder (e.g., parallel test workers) never
+    read a partially written file.
+    """
+    return filename.with_name(f".{os.getpid()}.{filename.name}")
+
+
 def _download_and_save_mdi(icon_mdi: str) -> Path:
     url = _mdi_url(icon_mdi)
     filename_svg = ASSETS_PATH / f"{icon_mdi}.svg"
@@ -1752,8 +1789,9 @@ def _download_and_save_mdi(icon_mdi: str) -> Path:
         console.log(f"[b red]{msg}[/]")
         raise ValueError(msg) from None
 
-    with filename_svg.open("wb") as f:
-        f.write(svg_content)
+    tmp_filename = _tmp_filename(filename_svg)
+    tmp_filename.write_bytes(svg_content)
+    tmp_filename.replace(filename_svg)
     return filename_svg
 
 
@@ -1771,10 +1809,9 @@ def _init_icon(
     if icon_filename is not None:
         icon_path = Path(icon_filename)
         path = icon_path if icon_path.is_absolute() else ASSETS_PATH / icon_path
-        icon = Image.open(path)
-        # Convert to RGB if needed
-        if icon.mode != "RGB":
-            icon = icon.convert("RGB")
+        with Image.open(path) as image:
+            # Convert to RGB, this also copies the pixels so the file can be closed
+            icon = image.convert("RGB")
         if icon.size != size:
             console.log(f"Resizing icon {icon_filename} to from {icon.size} to {size}")
             icon = icon.resize(size)
@@ -2475,7 +2512,10 @@ def _download_spotify_image(
     - "track/4o0LyB69tylqDG6eTGhmig"
     """
     if filename is not None and filename.exists():
-        return Image.open(filename)
+        with Image.open(filename) as image:
+            # Load the pixels before the file is closed
+            image.load()
+        return image
     url = f"https://embed.spotify.com/oembed/?url=http://open.spotify.com/{id_}"
     content = _download(url)
     data = json.loads(content)
@@ -2491,15 +2531,17 @@ def _download_image(
 ) -> Image.Image:
     """Download an image for a given url."""
     if filename is not None and filename.exists():
-        image = Image.open(filename)
-        # To correctly size after getting from file
-        return image.resize(size)
+        with Image.open(filename) as image:
+            # To correctly size after getting from file
+            return image.resize(size)
     image_content = _download(url)
     image = Image.open(io.BytesIO(image_content))
     if image.mode != "RGB":
         image = image.convert("RGB")
     if filename is not None:
-        image.save(filename)
+        tmp_filename = _tmp_filename(filename)
+        image.save(tmp_filename)
+        tmp_filename.replace(filename)
     return image.resize(size)
 
 
@@ -2590,7 +2632,7 @@ def safe_load_yaml(
             for item in node:
                 _traverse_yaml(item, variables)
 
-    class IncludeLoader(yaml.SafeLoader):
+    class IncludeLoader(YAML_LOADER):  # type: ignore[valid-type,misc]
         """YAML Loader with `!include` constructor."""
 
         def __init__(self, stream: Any) -> None:
@@ -2645,7 +2687,6 @@ def _help() -> str:
 def main() -> None:
     """Start the Stream Deck integration."""
     import argparse
-    import os
 
     from dotenv import load_dotenv
 
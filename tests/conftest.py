@@ -0,0 +1,30 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+import websockets
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the `--update-refs` option."""
+    parser.addoption(
+        "--update-refs",
+        action="store_true",
+        help="Write the generated images as the new reference images instead of comparing.",
+    )
+
+
+@pytest.fixture(scope="session")
+def _websocket_template() -> Mock:
+    """Spec'd websocket mock shared by every test in the session."""
+    return Mock(spec=websockets.WebSocketClientProtocol)
+
+
+@pytest.fixture
+def websocket_mock(_websocket_template: Mock) -> Mock:
+    """Mock websocket client protocol, with calls from earlier tests cleared."""
+    _websocket_template.reset_mock()
+    return _websocket_template
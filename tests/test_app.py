@@ -11,7 +11,6 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
-import websockets
 from dotenv import dotenv_values
 from PIL import Image
 from pydantic import ValidationError
@@ -313,10 +312,15 @@ def test_validate_special_type(button_dict: dict[str, dict[str, Any]]) -> None:
         Button(**dict(button_dict["special_goto_0"], special_type_data=[]))
 
 
-def test_download_and_save_mdi() -> None:
+def test_download_and_save_mdi(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test whether function downloads MDI correctly."""
-    # might be cached
+    # Download into a private directory, so deleting the icon below cannot
+    # race with tests on other xdist workers that read `assets/phone.svg`
+    monkeypatch.setattr("home_assistant_streamdeck_yaml.ASSETS_PATH", tmp_path)
+
+    # downloads
     filename = _download_and_save_mdi("phone")
+    assert filename.parent == tmp_path
     assert filename.exists()
 
     # is cached
@@ -510,12 +514,6 @@ def test_generate_uniform_hex_colors() -> None:
     )
 
 
-@pytest.fixture
-def websocket_mock() -> Mock:
-    """Mock websocket client protocol."""
-    return Mock(spec=websockets.WebSocketClientProtocol)
-
-
 async def test_handle_key_press_toggle_light(
     mock_deck: Mock,
     websocket_mock: Mock,
@@ -1094,6 +1092,40 @@ def test_icon_failed_icon() -> None:
     assert icon.size == (100, 100)
 
 
+@pytest.fixture
+async def virtual_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the running loop's clock with a virtual one.
+
+    Whenever the loop would block waiting for its next timer, the clock jumps
+    ahead instead, so `asyncio.sleep` calls resolve instantly while scheduled
+    callbacks still fire in the same order.
+
+    This hooks into `loop._selector`, a private attribute that only selector
+    event loops have; on other loops (Proactor, uvloop) the fixture does
+    nothing and the test runs on the real clock.
+    """
+    loop = asyncio.get_running_loop()
+    selector = getattr(loop, "_selector", None)
+    if selector is None:
+        return
+    now = loop.time()
+    select = selector.select
+
+    def _time() -> float:
+        return now
+
+    def _select(timeout: float | None = None) -> list:
+        nonlocal now
+        if timeout is not None and timeout > 0:
+            now += timeout
+            timeout = 0
+        return select(timeout)
+
+    monkeypatch.setattr(loop, "time", _time)
+    monkeypatch.setattr(selector, "select", _select)
+
+
+@pytest.mark.usefixtures("virtual_clock")
 async def test_delay() -> None:
     """Test the delay."""
     button = Button(delay=0.1)
@@ -1104,7 +1136,10 @@ async def test_delay() -> None:
     assert button._timer.is_sleeping
     assert button.is_sleeping()
     _ = button.render_icon({})
-    await asyncio.sleep(0.1)
+    # Wait for the timer itself, a `sleep(0.1)` would share its deadline on the
+    # virtual clock and leave the order of the two to the timer heap
+    assert button._timer.task is not None
+    await button._timer.task
     assert not button.is_sleeping()
 
 
@@ -1156,8 +1191,10 @@ async def test_anonymous_page(
     assert button.text == "foo"
     assert config._detached_page is not None
     assert config.current_page() == anon
+    assert button._timer is not None
     with patch("home_assistant_streamdeck_yaml.update_all_key_images") as mock:
-        await asyncio.sleep(0.15)  # longer than delay should then switch to home
+        # Expiring the delay should then switch to home, `test_delay` covers the timing
+        await button._timer._trigger_now()
         mock.assert_called_once()
     assert config._detached_page is None
     assert config.current_page() == home
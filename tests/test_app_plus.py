@@ -8,7 +8,6 @@ from typing import Any
 from unittest.mock import Mock
 
 import pytest
-import websockets
 from PIL import Image
 from StreamDeck.Devices.StreamDeck import DialEventType
 from StreamDeck.Devices.StreamDeckPlus import StreamDeckPlus
@@ -27,15 +26,15 @@ from home_assistant_streamdeck_yaml import (
 
 ROOT = Path(__file__).parent.parent
 TEST_STATE_FILENAME = ROOT / "tests" / "state_plus.json"
+DIAL_ORDER = [
+    "number_value",
+    "input_number",
+    "icon_mdi",
+    "spotify_icon",
+]
 
 
 # TESTS FOR STREAM DECK PLUS
-@pytest.fixture
-def websocket_mock() -> Mock:
-    """Mock websocket client protocol."""
-    return Mock(spec=websockets.WebSocketClientProtocol)
-
-
 @pytest.fixture
 def state() -> dict[str, dict[str, Any]]:
     """State fixture."""
@@ -43,9 +42,9 @@ def state() -> dict[str, dict[str, Any]]:
         return json.load(f)
 
 
-@pytest.fixture
-def mock_deck_plus() -> Mock:
-    """Mocks a StreamDeck Plus."""
+@pytest.fixture(scope="session")
+def _deck_plus_template() -> Mock:
+    """StreamDeck Plus mock, created once and reset by `mock_deck_plus` for each test."""
     deck_mock = Mock(spec=StreamDeckPlus)
 
     deck_mock.KEY_PIXEL_WIDTH = StreamDeckPlus.KEY_PIXEL_WIDTH
@@ -77,6 +76,16 @@ def mock_deck_plus() -> Mock:
     deck_mock.key_count.return_value = 8
     deck_mock.dial_count.return_value = 4
 
+    return deck_mock
+
+
+@pytest.fixture
+def mock_deck_plus(_deck_plus_template: Mock) -> Mock:
+    """Mocks a StreamDeck Plus."""
+    deck_mock = _deck_plus_template
+    # Clears recorded calls but keeps the configured return values
+    deck_mock.reset_mock()
+
     deck_mock.__enter__ = Mock(return_value=deck_mock)
     deck_mock.__exit__ = Mock(return_value=False)
 
@@ -167,14 +176,22 @@ def state_change_msg() -> dict[str, Any]:
 @pytest.fixture
 def dials(dial_dict: dict[str, dict[str, Any]]) -> list[Dial]:
     """Order of dials for page."""
-    dial_order = [
-        "number_value",
-        "input_number",
-        "icon_mdi",
-        "spotify_icon",
-    ]
+    return [Dial(**dial_dict[key]) for key in DIAL_ORDER]
 
-    return [Dial(**dial_dict[key]) for key in dial_order]
+
+@pytest.fixture
+def config_plus(dials: list[Dial]) -> Config:
+    """Config with the pages `home` and `page_1` and the anonymous `page_anon`."""
+    home = Page(
+        name="home",
+        buttons=[
+            Button(special_type="go-to-page", special_type_data="page_1"),
+            Button(special_type="go-to-page", special_type_data="page_anon"),
+        ],
+    )
+    page_1 = Page(name="page_1", dials=dials)
+    page_anon = Page(name="page_anon", dials=dials)
+    return Config(pages=[home, page_1], anonymous_pages=[page_anon])
 
 
 def test_dials(dials: list[Dial], state: dict[str, dict[str, Any]]) -> None:
@@ -231,25 +248,12 @@ async def test_streamdeck_plus(
     mock_deck_plus: Mock,
     websocket_mock: Mock,
     state: dict[str, dict[str, Any]],
-    dials: list[Dial],
+    config_plus: Config,
     state_change_msg: dict[str, dict[str, Any]],
 ) -> None:
     """Tests dials, buttons and pages on streamdeck plus with state change."""
-    home = Page(
-        name="home",
-        buttons=[
-            Button(special_type="go-to-page", special_type_data="page_1"),
-            Button(special_type="go-to-page", special_type_data="page_anon"),
-        ],
-    )
-
-    page_1 = Page(
-        name="page_1",
-        dials=dials,
-    )
-
-    page_anon = Page(name="page_anon", dials=dials)
-    config = Config(pages=[home, page_1], anonymous_pages=[page_anon])
+    config = config_plus
+    page_1 = config.pages[1]
     assert config._current_page_index == 0
     assert config.to_page("page_1") == page_1
     assert config.current_page() == page_1
@@ -289,29 +293,17 @@ async def test_touchscreen(
     mock_deck_plus: Mock,
     websocket_mock: Mock,
     state: dict[str, dict[str, Any]],
-    dials: list[Dial],
+    config_plus: Config,
 ) -> None:
     """Test touchscreen events for dial."""
-    home = Page(
-        name="home",
-        buttons=[
-            Button(special_type="go-to-page", special_type_data="page_1"),
-            Button(special_type="go-to-page", special_type_data="page_anon"),
-        ],
-    )
-
-    page_1 = Page(
-        name="page_1",
-        dials=dials,
-    )
-
-    page_anon = Page(name="page_anon", dials=dials)
-    config = Config(pages=[home, page_1], anonymous_pages=[page_anon])
+    config = config_plus
+    home, page_1 = config.pages
     assert config._current_page_index == 0
     assert config.current_page() == home
 
-    # Check if you can change page using Touchscreen.
     touch_event = _on_touchscreen_event_callback(websocket_mock, state, config)
+
+    # Check if you can change page using Touchscreen.
     await touch_event(
         mock_deck_plus,
         TouchscreenEventType.DRAG,
@@ -329,7 +321,6 @@ async def test_touchscreen(
     dial = config.dial(0)
     assert dial is not None
 
-    touch_event = _on_touchscreen_event_callback(websocket_mock, state, config)
     await touch_event(
         mock_deck_plus,
         TouchscreenEventType.LONG,
@@ -342,7 +333,6 @@ async def test_touchscreen(
     assert attributes["state"] == attributes["max"]
 
     # Check if you can set min using touchscreen.
-    touch_event = _on_touchscreen_event_callback(websocket_mock, state, config)
     await touch_event(
         mock_deck_plus,
         TouchscreenEventType.SHORT,
@@ -359,7 +349,6 @@ async def test_touchscreen(
     assert dial is not None
     assert dial.allow_touchscreen_events is not True
 
-    touch_event = _on_touchscreen_event_callback(websocket_mock, state, config)
     await touch_event(
         mock_deck_plus,
         TouchscreenEventType.SHORT,